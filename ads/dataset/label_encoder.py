@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8; -*-
 
-# Copyright (c) 2020, 2023 Oracle and/or its affiliates.
+# Copyright (c) 2020, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 import bisect
@@ -85,13 +85,14 @@ class DataFrameLabelEncoder(TransformerMixin):
             return X
 
         def _label_encode_with_unknown(name, series):
-            return self.label_encoders[name].transform(
-                series.map(lambda x: str(x)).map(
-                    lambda x: x
-                    if x in self.label_encoders[name].classes_
-                    else "unknown"
-                )
-            )
+            classes = self.label_encoders[name].classes_
+            values = series.astype(str).to_numpy(dtype=str)
+            # The classes are sorted, same lookup as `LabelEncoder.transform`
+            # done on the whole column, instead of checking the classes value by value.
+            codes = np.searchsorted(classes, values, side="right") - 1
+            known = classes[codes] == values
+            codes[~known] = np.searchsorted(classes, "unknown", side="right") - 1
+            return codes
 
         X[categorical_columns] = X[categorical_columns].apply(
             lambda series: _label_encode_with_unknown(series.name, series)
@@ -3,19 +3,57 @@
 
 # Copyright (c) 2023, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
-from typing import Any, Dict, List, Optional
+import functools
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 from langchain.llms.base import LLM
 from langchain.pydantic_v1 import BaseModel, Field, root_validator
 
-from ads.common.auth import default_signer
+from ads.common.auth import AuthState, AuthType, default_signer
 from ads.config import COMPARTMENT_OCID
 
 
+def _auth_state_key() -> str:
+    """Returns a key representing the current ADS auth state.
+    The key changes whenever `ads.set_auth()` updates the auth settings."""
+    return repr(sorted(vars(AuthState()).items()))
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_default_signer(auth_state_key: str) -> Dict:
+    """Caches the output of `default_signer()` for the given auth state."""
+    return default_signer()
+
+
+def _default_signer() -> Dict:
+    """Returns the default ADS auth dictionary.
+    The signer is only loaded again when the ADS auth state changes.
+    A shallow copy is returned so that the cached dictionary is not modified by the caller.
+    """
+    auth_state = AuthState()
+    # The security token is validated and refreshed only when the signer is created,
+    # and a signer callable is expected to create a new signer every time,
+    # so these signers are not cached.
+    if (
+        auth_state.oci_iam_type == AuthType.SECURITY_TOKEN
+        or auth_state.oci_signer_callable
+    ):
+        return default_signer()
+    return dict(_cached_default_signer(_auth_state_key()))
+
+
+@functools.lru_cache(maxsize=32)
+def _stop_pattern(stop: Tuple[str, ...]) -> Pattern:
+    """Compiles the stop words into a single regex alternation,
+    so that the output is scanned once regardless of the number of stop words."""
+    return re.compile("|".join(re.escape(word) for word in stop))
+
+
 class BaseLLM(LLM):
     """Base OCI LLM class. Contains common attributes."""
 
-    auth: dict = Field(default_factory=default_signer, exclude=True)
+    auth: dict = Field(default_factory=_default_signer, exclude=True)
     """ADS auth dictionary for OCI authentication.
     This can be generated by calling `ads.common.auth.api_keys()` or `ads.common.auth.resource_principal()`.
     If this is not provided then the `ads.common.default_signer()` will be used."""
@@ -29,12 +67,21 @@ class BaseLLM(LLM):
     k: int = 0
     """Number of most likely tokens to consider at each step."""
 
-    p: int = 0.75
+    p: float = 0.75
     """Total probability mass of tokens to consider at each step."""
 
     stop: Optional[List[str]] = None
     """Stop words to use when generating. Model output is cut off at the first occurrence of any of these substrings."""
 
+    @staticmethod
+    def _cut_at_stop(text: str, stop: Optional[List[str]]) -> str:
+        """Cuts off the text at the first occurrence of any of the stop words."""
+        stop = tuple(word for word in stop or [] if word)
+        if not stop:
+            return text
+        match = _stop_pattern(stop).search(text)
+        return text[: match.start()] if match else text
+
     def _print_request(self, prompt, params):
         if self.verbose:
             print(f"LLM API Request:\n{prompt}")
@@ -60,7 +107,7 @@ class GenerativeAiClientModel(BaseModel):
     # This auth is the same as the auth in BaseLLM class.
     # However, this is needed for the Gen AI embedding model.
     # Do not remove this attribute
-    auth: dict = Field(default_factory=default_signer, exclude=True)
+    auth: dict = Field(default_factory=_default_signer, exclude=True)
     """ADS auth dictionary for OCI authentication.
     This can be generated by calling `ads.common.auth.api_keys()` or `ads.common.auth.resource_principal()`.
     If this is not provided then the `ads.common.default_signer()` will be used."""
@@ -78,6 +125,7 @@ class GenerativeAiClientModel(BaseModel):
     """Holds any client parameters for creating GenerativeAiClient"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _import_client():
         try:
             from oci.generative_ai_inference import GenerativeAiInferenceClient
@@ -88,6 +136,47 @@ class GenerativeAiClientModel(BaseModel):
             ) from ex
         return GenerativeAiInferenceClient
 
+    @classmethod
+    def construct_with_client(
+        cls, client: Any, compartment_id: Optional[str] = None, **kwargs
+    ) -> "GenerativeAiClientModel":
+        """Creates a model from an existing OCI client without running the pydantic validation.
+
+        This should only be used when the client and the other attributes are already validated,
+        for example, when creating many models sharing the same client.
+        Default values are still set for the attributes not specified.
+
+        Parameters
+        ----------
+        client : Any
+            OCI GenerativeAiInferenceClient.
+        compartment_id : str, optional
+            Compartment ID of the caller. Defaults to `COMPARTMENT_OCID` from the environment.
+        kwargs :
+            Other attributes of the model.
+            The `auth` defaults to an empty dictionary, the default signer is not loaded.
+
+        Raises
+        ------
+        ValueError
+            If compartment_id is not specified and it is not available from the environment.
+
+        Returns
+        -------
+        GenerativeAiClientModel
+            The model instance.
+        """
+        compartment_id = compartment_id or COMPARTMENT_OCID
+        if not compartment_id:
+            raise ValueError("Please specify compartment_id.")
+        # The client is already created, pass the auth so that construct() does not load the default signer.
+        return cls.construct(
+            client=client,
+            compartment_id=compartment_id,
+            auth=kwargs.pop("auth", {}),
+            **kwargs,
+        )
+
     @root_validator()
     def validate_environment(  # pylint: disable=no-self-argument
         cls, values: Dict
@@ -97,8 +186,11 @@ class GenerativeAiClientModel(BaseModel):
         # Users may choose to initialize the OCI client by themselves and pass it into this model.
         if not values.get("client"):
             auth = values.get("auth", {})
-            client_kwargs = auth.get("client_kwargs") or {}
-            client_kwargs.update(values["client_kwargs"])
+            # Copy the client_kwargs so that the (cached) auth dictionary is not modified.
+            client_kwargs = {
+                **(auth.get("client_kwargs") or {}),
+                **(values.get("client_kwargs") or {}),
+            }
             # Import the GenerativeAIClient here so that there will be no error when user import ads.llm
             # and the install OCI SDK does not support generative AI service yet.
             client_class = cls._import_client()
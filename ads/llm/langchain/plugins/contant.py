@@ -5,14 +5,21 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 from enum import Enum
 
+try:
+    # Python 3.11+
+    from enum import StrEnum
+except ImportError:
 
-class StrEnum(str, Enum):
-    """Enum with string members
-    https://docs.python.org/3.11/library/enum.html#enum.StrEnum
-    """
+    class StrEnum(str, Enum):
+        """Enum with string members
+        https://docs.python.org/3.11/library/enum.html#enum.StrEnum
+        """
 
-    # Pydantic uses Python's standard enum classes to define choices.
-    # https://docs.pydantic.dev/latest/api/standard_library_types/#enum
+        # Pydantic uses Python's standard enum classes to define choices.
+        # https://docs.pydantic.dev/latest/api/standard_library_types/#enum
+
+        def __str__(self) -> str:
+            return str(self.value)
 
 
 DEFAULT_TIME_OUT = 300
@@ -205,8 +205,9 @@ class GenerativeAI(GenerativeAiClientModel, BaseLLM):
         )
 
         # truncate and stop_sequence are not supported.
+        # The stop words are applied on the completion instead.
         kwargs.pop("truncate", None)
-        kwargs.pop("stop_sequences", None)
+        stop = kwargs.pop("stop_sequences", None)
         # top_k must be >1 or -1
         if "top_k" in kwargs and kwargs["top_k"] == 0:
             kwargs.pop("top_k")
@@ -220,9 +221,11 @@ class GenerativeAI(GenerativeAiClientModel, BaseLLM):
         )
         response: LlamaLlmInferenceResponse
         if kwargs.get("num_generations", 1) == 1:
-            completion = response.choices[0].text
+            completion = self._cut_at_stop(response.choices[0].text, stop)
         else:
-            completion = [result.text for result in response.choices]
+            completion = [
+                self._cut_at_stop(result.text, stop) for result in response.choices
+            ]
         self._print_response(completion, response)
         return completion
 
@@ -31,6 +31,9 @@ AUTOMLX_DEFAULT_SCORE_METRIC = "neg_sym_mean_abs_percent_error"
 class AutoMLXOperatorModel(ForecastOperatorBaseModel):
     """Class representing AutoMLX operator model."""
 
+    # The thread safety of the AutoMLX forecast and predict calls is not guaranteed.
+    explain_series_in_parallel = False
+
     def __init__(self, config: ForecastOperatorConfig, datasets: ForecastDatasets):
         super().__init__(config, datasets)
         self.global_explanation = {}
@@ -8,11 +8,13 @@ import fsspec
 import numpy as np
 import os
 import pandas as pd
+import shutil
 import tempfile
 import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import Tuple
+from joblib import Parallel, delayed
+from typing import Dict, Optional, Tuple
 
 from ads.common.decorator.runtime_dependency import runtime_dependency
 from ads.common.object_storage_details import ObjectStorageDetails
@@ -32,7 +34,8 @@ from ads.opctl.operator.lowcode.forecast.utils import (
     evaluate_train_metrics,
     get_forecast_plots,
     get_auto_select_plot,
-    _build_metrics_df,
+    _build_metrics_df_by_series,
+    _stack_series,
     _build_metrics_per_horizon,
     load_pkl,
     write_pkl,
@@ -52,6 +55,10 @@ from ..operator_config import ForecastOperatorConfig, ForecastOperatorSpec
 class ForecastOperatorBaseModel(ABC):
     """The base class for the forecast operator models."""
 
+    # Whether the series can be explained in parallel threads in `explain_model`.
+    # Only enable this for models whose predictions can be called from several threads at once.
+    explain_series_in_parallel = True
+
     def __init__(self, config: ForecastOperatorConfig, datasets: ForecastDatasets):
         """Instantiates the ForecastOperatorBaseModel instance.
 
@@ -81,6 +88,8 @@ class ForecastOperatorBaseModel(ABC):
         self.forecast_output = None
         self.errors_dict = dict()
         self.le = dict()
+        # populated by the model factory when the model is auto-selected
+        self.backtest_stats = None
 
         self.formatted_global_explanation = None
         self.formatted_local_explanation = None
@@ -100,7 +109,6 @@ class ForecastOperatorBaseModel(ABC):
             warnings.simplefilter(action="ignore", category=UserWarning)
             warnings.simplefilter(action="ignore", category=RuntimeWarning)
             warnings.simplefilter(action="ignore", category=ConvergenceWarning)
-            import report_creator as rc
 
             # load models if given
             if self.spec.previous_output_dir is not None:
@@ -127,6 +135,8 @@ class ForecastOperatorBaseModel(ABC):
                             test_data,
                         ) = self._test_evaluate_metrics(
                             elapsed_time=elapsed_time,
+                            # The summary metrics are only shown in the report.
+                            summary=self.spec.generate_report,
                         )
                     except Exception as e:
                         logger.warn("Unable to generate Test Metrics.")
@@ -134,11 +144,14 @@ class ForecastOperatorBaseModel(ABC):
             report_sections = []
 
             if self.spec.generate_report:
+                import report_creator as rc
+
                 # build the report
                 (
                     model_description,
                     other_sections,
                 ) = self._generate_report()
+                num_series = len(self.datasets.list_series_ids())
 
                 header_section = rc.Block(
                     rc.Heading("Forecast Report", level=1),
@@ -164,37 +177,24 @@ class ForecastOperatorBaseModel(ABC):
                         ),
                         rc.Metric(
                             heading="Num series",
-                            value=len(self.datasets.list_series_ids()),
+                            value=num_series,
                         ),
                     ),
                 )
 
-                first_5_rows_blocks = [
-                    rc.DataTable(
-                        df.head(5),
-                        label=s_id,
-                        index=True,
+                first_5_rows_blocks = []
+                last_5_rows_blocks = []
+                data_summary_blocks = []
+                for s_id, df in self.full_data_dict.items():
+                    first_5_rows_blocks.append(
+                        rc.DataTable(df.head(5), label=s_id, index=True)
                     )
-                    for s_id, df in self.full_data_dict.items()
-                ]
-
-                last_5_rows_blocks = [
-                    rc.DataTable(
-                        df.tail(5),
-                        label=s_id,
-                        index=True,
+                    last_5_rows_blocks.append(
+                        rc.DataTable(df.tail(5), label=s_id, index=True)
                     )
-                    for s_id, df in self.full_data_dict.items()
-                ]
-
-                data_summary_blocks = [
-                    rc.DataTable(
-                        df.describe(),
-                        label=s_id,
-                        index=True,
+                    data_summary_blocks.append(
+                        rc.DataTable(df.describe(), label=s_id, index=True)
                     )
-                    for s_id, df in self.full_data_dict.items()
-                ]
 
                 series_name = merged_category_column_name(
                     self.spec.target_category_columns
@@ -250,12 +250,16 @@ class ForecastOperatorBaseModel(ABC):
 
                 backtest_sections = []
                 if self.spec.model == AUTO_SELECT:
-                    output_dir = self.spec.output_directory.url
-                    backtest_report_name = "backtest_stats.csv"
-                    backtest_stats = pd.read_csv(f"{output_dir}/{backtest_report_name}")
-                    average_dict = backtest_stats.mean().to_dict()
-                    del average_dict['backtest']
-                    best_model = min(average_dict, key=average_dict.get)
+                    backtest_stats = self.backtest_stats
+                    if backtest_stats is None:
+                        output_dir = self.spec.output_directory.url
+                        backtest_report_name = "backtest_stats.csv"
+                        backtest_stats = pd.read_csv(
+                            f"{output_dir}/{backtest_report_name}"
+                        )
+                    average_metrics = backtest_stats.drop(columns=["backtest"]).mean()
+                    average_dict = average_metrics.to_dict()
+                    best_model = average_metrics.idxmin()
                     backtest_text = rc.Heading("Back Testing Metrics", level=2)
                     summary_text = rc.Text(
                         f"Overall, the average scores for the models are {average_dict}, with {best_model}"
@@ -276,10 +280,7 @@ class ForecastOperatorBaseModel(ABC):
                         test_data=test_data,
                         ci_interval_width=self.spec.confidence_interval_width,
                     )
-                    if (
-                        series_name is not None
-                        and len(self.datasets.list_series_ids()) > 1
-                    ):
+                    if series_name is not None and num_series > 1:
                         forecast_plots = [
                             forecast_text,
                             forecast_sec,
@@ -307,28 +308,35 @@ class ForecastOperatorBaseModel(ABC):
                 test_metrics_df=self.test_eval_metrics,
             )
 
-    def _test_evaluate_metrics(self, elapsed_time=0):
+    def _test_evaluate_metrics(self, elapsed_time=0, summary=True):
         total_metrics = pd.DataFrame()
         summary_metrics = pd.DataFrame()
         data = TestData(self.spec)
 
-        # Generate y_pred and y_true for each series
+        # Collect y_pred and y_true for each series
+        horizon = self.spec.horizon
+        test_data_by_series = data.get_dict_by_series()
+        series_ids = []
+        y_true_list = []
+        y_pred_list = []
         for s_id in self.forecast_output.list_series_ids():
             try:
-                y_true = data.get_data_for_series(s_id)[data.target_name].values[
-                    -self.spec.horizon :
+                y_true = test_data_by_series[s_id][data.target_name].to_numpy()[
+                    -horizon:
                 ]
             except KeyError as ke:
                 logger.warn(
                     f"Error Generating Metrics: Unable to find {s_id} in the test data. Error: {ke.args}"
                 )
-            y_pred = self.forecast_output.get_forecast(s_id)["forecast_value"].values[
-                -self.spec.horizon :
-            ]
-
-            drop_na_mask = ~np.isnan(y_true) & ~np.isnan(y_pred)
-            if not drop_na_mask.all():  # There is a missing value
-                if drop_na_mask.any():  # All values are missing
+                continue
+            y_pred = self.forecast_output.get_forecast(s_id)[
+                "forecast_value"
+            ].to_numpy()[-horizon:]
+
+            drop_na_mask = ~(np.isnan(y_true) | np.isnan(y_pred))
+            n_valid = np.count_nonzero(drop_na_mask)
+            if n_valid < drop_na_mask.size:  # There is a missing value
+                if n_valid == 0:  # All values are missing
                     logger.debug(
                         f"No values in the test data for series: {s_id}. This will affect the test metrics."
                     )
@@ -336,55 +344,62 @@ class ForecastOperatorBaseModel(ABC):
                 logger.debug(
                     f"Missing values in the test data for series: {s_id}. This will affect the test metrics."
                 )
-                y_true = y_true[drop_na_mask]
-                y_pred = y_pred[drop_na_mask]
-
-            metrics_df = _build_metrics_df(
-                y_true=y_true,
-                y_pred=y_pred,
-                series_id=s_id,
+            series_ids.append(s_id)
+            y_true_list.append(y_true)
+            y_pred_list.append(y_pred)
+
+        # Generate the metrics for all the series at once.
+        # The missing values are kept as NaN and ignored when calculating the metrics.
+        if series_ids:
+            total_metrics = _build_metrics_df_by_series(
+                y_true=_stack_series(y_true_list),
+                y_pred=_stack_series(y_pred_list),
+                series_ids=series_ids,
             )
-            total_metrics = pd.concat([total_metrics, metrics_df], axis=1)
 
-        if total_metrics.empty:
+        if total_metrics.empty or not summary:
             return total_metrics, summary_metrics, data
 
-        summary_metrics = pd.DataFrame(
-            {
-                SupportedMetrics.MEAN_SMAPE: np.mean(
-                    total_metrics.loc[SupportedMetrics.SMAPE]
-                ),
-                SupportedMetrics.MEDIAN_SMAPE: np.median(
-                    total_metrics.loc[SupportedMetrics.SMAPE]
-                ),
-                SupportedMetrics.MEAN_MAPE: np.mean(
-                    total_metrics.loc[SupportedMetrics.MAPE]
-                ),
-                SupportedMetrics.MEDIAN_MAPE: np.median(
-                    total_metrics.loc[SupportedMetrics.MAPE]
-                ),
-                SupportedMetrics.MEAN_RMSE: np.mean(
-                    total_metrics.loc[SupportedMetrics.RMSE]
-                ),
-                SupportedMetrics.MEDIAN_RMSE: np.median(
-                    total_metrics.loc[SupportedMetrics.RMSE]
-                ),
-                SupportedMetrics.MEAN_R2: np.mean(
-                    total_metrics.loc[SupportedMetrics.R2]
-                ),
-                SupportedMetrics.MEDIAN_R2: np.median(
-                    total_metrics.loc[SupportedMetrics.R2]
-                ),
-                SupportedMetrics.MEAN_EXPLAINED_VARIANCE: np.mean(
-                    total_metrics.loc[SupportedMetrics.EXPLAINED_VARIANCE]
-                ),
-                SupportedMetrics.MEDIAN_EXPLAINED_VARIANCE: np.median(
-                    total_metrics.loc[SupportedMetrics.EXPLAINED_VARIANCE]
-                ),
-                SupportedMetrics.ELAPSED_TIME: elapsed_time,
-            },
-            index=["All Targets"],
+        # (metric, mean of the metric, median of the metric)
+        metrics = [
+            (
+                SupportedMetrics.SMAPE,
+                SupportedMetrics.MEAN_SMAPE,
+                SupportedMetrics.MEDIAN_SMAPE,
+            ),
+            (
+                SupportedMetrics.MAPE,
+                SupportedMetrics.MEAN_MAPE,
+                SupportedMetrics.MEDIAN_MAPE,
+            ),
+            (
+                SupportedMetrics.RMSE,
+                SupportedMetrics.MEAN_RMSE,
+                SupportedMetrics.MEDIAN_RMSE,
+            ),
+            (
+                SupportedMetrics.R2,
+                SupportedMetrics.MEAN_R2,
+                SupportedMetrics.MEDIAN_R2,
+            ),
+            (
+                SupportedMetrics.EXPLAINED_VARIANCE,
+                SupportedMetrics.MEAN_EXPLAINED_VARIANCE,
+                SupportedMetrics.MEDIAN_EXPLAINED_VARIANCE,
+            ),
+        ]
+        # Reduce all the metrics across the series at once, one row per metric.
+        metrics_values = total_metrics.loc[[m[0] for m in metrics]].to_numpy(
+            dtype=float
         )
+        means = np.nanmean(metrics_values, axis=1)
+        medians = np.median(metrics_values, axis=1)
+        summary_values = dict()
+        for (_, mean_name, median_name), mean, median in zip(metrics, means, medians):
+            summary_values[mean_name] = mean
+            summary_values[median_name] = median
+        summary_values[SupportedMetrics.ELAPSED_TIME] = elapsed_time
+        summary_metrics = pd.DataFrame(summary_values, index=["All Targets"])
 
         """Calculates Mean sMAPE, Median sMAPE, Mean MAPE, Median MAPE, Mean wMAPE, Median wMAPE values for each horizon
         if horizon <= 10."""
@@ -423,8 +438,6 @@ class ForecastOperatorBaseModel(ABC):
         test_metrics_df: pd.DataFrame,
     ):
         """Saves resulting reports to the given folder."""
-        import report_creator as rc
-
         unique_output_dir = self.spec.output_directory.url
 
         if ObjectStorageDetails.is_oci_path(unique_output_dir):
@@ -434,6 +447,8 @@ class ForecastOperatorBaseModel(ABC):
 
         # report-creator html report
         if self.spec.generate_report:
+            import report_creator as rc
+
             with tempfile.TemporaryDirectory() as temp_dir:
                 report_local_path = os.path.join(temp_dir, "___report.html")
                 disable_print()
@@ -442,13 +457,14 @@ class ForecastOperatorBaseModel(ABC):
                 enable_print()
 
                 report_path = os.path.join(unique_output_dir, self.spec.report_filename)
-                with open(report_local_path) as f1:
+                with open(report_local_path, "rb") as f1:
                     with fsspec.open(
                         report_path,
-                        "w",
+                        "wb",
                         **storage_options,
                     ) as f2:
-                        f2.write(f1.read())
+                        # Copy in chunks rather than reading the whole report into memory
+                        shutil.copyfileobj(f1, f2, length=1024 * 1024)
 
         # forecast csv report
         write_data(
@@ -465,11 +481,15 @@ class ForecastOperatorBaseModel(ABC):
                 if self.datasets.has_artificial_series()
                 else "Series 1"
             )
+
+            def _prep_metrics_for_csv(df):
+                return df.rename(columns={"Series 1": metrics_col_name}).reset_index(
+                    names="metrics"
+                )
+
             if metrics_df is not None:
                 write_data(
-                    data=metrics_df.reset_index().rename(
-                        {"index": "metrics", "Series 1": metrics_col_name}, axis=1
-                    ),
+                    data=_prep_metrics_for_csv(metrics_df),
                     filename=os.path.join(
                         unique_output_dir, self.spec.metrics_filename
                     ),
@@ -486,9 +506,7 @@ class ForecastOperatorBaseModel(ABC):
             if self.spec.test_data is not None:
                 if test_metrics_df is not None:
                     write_data(
-                        data=test_metrics_df.reset_index().rename(
-                            {"index": "metrics", "Series 1": metrics_col_name}, axis=1
-                        ),
+                        data=_prep_metrics_for_csv(test_metrics_df),
                         filename=os.path.join(
                             unique_output_dir, self.spec.test_metrics_filename
                         ),
@@ -641,64 +659,49 @@ class ForecastOperatorBaseModel(ABC):
             dict: A dictionary containing the global explanation for each feature in the dataset.
                     The keys are the feature names and the values are the average absolute SHAP values.
         """
-        from shap import PermutationExplainer
+        if not self.models:
+            logger.warn("Skipping explanations, as no forecast was generated.")
+            return
 
         datetime_col_name = self.datasets._datetime_column_name
 
-        exp_start_time = time.time()
-        global_ex_time = 0
-        local_ex_time = 0
         logger.info(
             f"Calculating explanations using {self.spec.explanations_accuracy_mode} mode"
         )
         ratio = SpeedAccuracyMode.ratio[self.spec.explanations_accuracy_mode]
 
-        for s_id, data_i in self.datasets.get_data_by_series(
-            include_horizon=False
-        ).items():
+        data_by_series = self.datasets.get_data_by_series(include_horizon=False)
+        series_ids = []
+        for s_id in data_by_series:
             if s_id in self.models:
-                explain_predict_fn = self.get_explain_predict_fn(series_id=s_id)
-                data_trimmed = data_i.tail(
-                    max(int(len(data_i) * ratio), 5)
-                ).reset_index(drop=True)
-                data_trimmed[datetime_col_name] = data_trimmed[datetime_col_name].apply(
-                    lambda x: x.timestamp()
-                )
-
-                # Explainer fails when boolean columns are passed
-
-                _, data_trimmed_encoded = _label_encode_dataframe(
-                    data_trimmed,
-                    no_encode={datetime_col_name, self.original_target_column},
-                )
-
-                kernel_explnr = PermutationExplainer(
-                    model=explain_predict_fn, masker=data_trimmed_encoded
-                )
-                kernel_explnr_vals = kernel_explnr.shap_values(data_trimmed_encoded)
-                exp_end_time = time.time()
-                global_ex_time = global_ex_time + exp_end_time - exp_start_time
-                self.local_explainer(
-                    kernel_explnr, series_id=s_id, datetime_col_name=datetime_col_name
-                )
-                local_ex_time = local_ex_time + time.time() - exp_end_time
-
-                if not len(kernel_explnr_vals):
-                    logger.warn(
-                        f"No explanations generated. Ensure that additional data has been provided."
-                    )
-                else:
-                    self.global_explanation[s_id] = dict(
-                        zip(
-                            data_trimmed.columns[1:],
-                            np.average(np.absolute(kernel_explnr_vals[:, 1:]), axis=0),
-                        )
-                    )
+                series_ids.append(s_id)
             else:
                 logger.warn(
                     f"Skipping explanations for {s_id}, as forecast was not generated."
                 )
 
+        # Each series is explained in its own thread, unless the model does not support it.
+        # The explanations are collected here, in the order of the series, so that the
+        # order of the outputs does not depend on which thread finishes first.
+        explanations = Parallel(
+            n_jobs=-1 if self.explain_series_in_parallel else 1, require="sharedmem"
+        )(
+            delayed(self._explain_series)(
+                s_id, data_by_series[s_id], ratio, datetime_col_name
+            )
+            for s_id in series_ids
+        )
+        global_ex_time = 0
+        local_ex_time = 0
+        for s_id, (global_explanation, local_explanation, ex_times) in zip(
+            series_ids, explanations
+        ):
+            if global_explanation is not None:
+                self.global_explanation[s_id] = global_explanation
+            self.local_explanation[s_id] = local_explanation
+            global_ex_time += ex_times[0]
+            local_ex_time += ex_times[1]
+
         logger.info(
             "Global explanations generation completed in %s seconds", global_ex_time
         )
@@ -706,13 +709,87 @@ class ForecastOperatorBaseModel(ABC):
             "Local explanations generation completed in %s seconds", local_ex_time
         )
 
-    def local_explainer(self, kernel_explainer, series_id, datetime_col_name) -> None:
+    def _explain_series(
+        self, s_id, data_i, ratio, datetime_col_name
+    ) -> Tuple[Optional[Dict], pd.DataFrame, Tuple[float, float]]:
+        """
+        Generates the global and local explanations for a single series.
+        The explanations are returned instead of being stored in the instance. The only
+        writes to the instance are per-series keys made by the model's predict function
+        (e.g. `self.le[series_id]` set in `preprocess`), so the series can be explained in parallel.
+
+        Returns
+        -------
+            Tuple[Optional[Dict], pd.DataFrame, Tuple[float, float]]:
+                The global explanation (None when no explanations were generated),
+                the local explanation, and the time in seconds taken to generate
+                the global and the local explanations.
+        """
+        from shap import PermutationExplainer
+
+        exp_start_time = time.time()
+        explain_predict_fn = self.get_explain_predict_fn(series_id=s_id)
+        data_trimmed = data_i.tail(max(int(len(data_i) * ratio), 5)).reset_index(
+            drop=True
+        )
+        data_trimmed[datetime_col_name] = datetime_to_seconds(
+            data_trimmed[datetime_col_name]
+        )
+
+        # Explainer fails when boolean columns are passed
+
+        le, data_trimmed_encoded = _label_encode_dataframe(
+            data_trimmed,
+            no_encode={datetime_col_name, self.original_target_column},
+        )
+
+        kernel_explnr = PermutationExplainer(
+            model=explain_predict_fn, masker=data_trimmed_encoded
+        )
+        kernel_explnr_vals = kernel_explnr.shap_values(data_trimmed_encoded)
+        exp_end_time = time.time()
+        local_explanation = self.local_explainer(
+            kernel_explnr,
+            series_id=s_id,
+            datetime_col_name=datetime_col_name,
+            le=le,
+        )
+        local_ex_time = time.time() - exp_end_time
+
+        global_explanation = None
+        if not len(kernel_explnr_vals):
+            logger.warn(
+                f"No explanations generated. Ensure that additional data has been provided."
+            )
+        else:
+            # The mean absolute SHAP value of each feature.
+            global_explanation = dict(
+                zip(
+                    data_trimmed.columns[1:].tolist(),
+                    np.abs(kernel_explnr_vals[:, 1:]).mean(axis=0).tolist(),
+                )
+            )
+        return (
+            global_explanation,
+            local_explanation,
+            (exp_end_time - exp_start_time, local_ex_time),
+        )
+
+    def local_explainer(
+        self, kernel_explainer, series_id, datetime_col_name, le=None
+    ) -> pd.DataFrame:
         """
         Generate local explanations using a kernel explainer.
 
         Parameters
         ----------
             kernel_explainer: The kernel explainer object to use for generating explanations.
+            le: The label encoder fitted on the data used to build the explainer.
+                When provided, the horizon data is encoded with it instead of fitting a new one.
+
+        Returns
+        -------
+            pd.DataFrame: The local SHAP values of the horizon of the series.
         """
         data = self.datasets.get_horizon_at_series(s_id=series_id)
         # columns that were dropped in train_model in arima, should be dropped here as well
@@ -721,16 +798,13 @@ class ForecastOperatorBaseModel(ABC):
 
         # Explainer fails when boolean columns are passed
         _, data = _label_encode_dataframe(
-            data, no_encode={datetime_col_name, self.original_target_column}
+            data, no_encode={datetime_col_name, self.original_target_column}, le=le
         )
         # Generate local SHAP values using the kernel explainer
         local_kernel_explnr_vals = kernel_explainer.shap_values(data)
 
         # Convert the SHAP values into a DataFrame
-        local_kernel_explnr_df = pd.DataFrame(
-            local_kernel_explnr_vals, columns=data.columns
-        )
-        self.local_explanation[series_id] = local_kernel_explnr_df
+        return pd.DataFrame(local_kernel_explnr_vals, columns=data.columns)
 
     def get_explain_predict_fn(self, series_id, fcst_col_name="yhat"):
         def _custom_predict(
@@ -4,6 +4,10 @@
 # Copyright (c) 2023 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+from typing import Tuple
+
+import pandas as pd
+
 from ..const import SupportedModels, AUTO_SELECT
 from ..operator_config import ForecastOperatorConfig
 from .arima import ArimaOperatorModel
@@ -63,12 +67,17 @@ class ForecastOperatorModelFactory:
             In case of not supported model.
         """
         model_type = operator_config.spec.model
+        backtest_stats = None
         if model_type == AUTO_SELECT:
-            model_type = cls.auto_select_model(datasets, operator_config)
+            model_type, backtest_stats = cls._auto_select_model(
+                datasets, operator_config
+            )
             operator_config.spec.model_kwargs = dict()
         if model_type not in cls._MAP:
             raise UnSupportedModelError(model_type)
-        return cls._MAP[model_type](config=operator_config, datasets=datasets)
+        model = cls._MAP[model_type](config=operator_config, datasets=datasets)
+        model.backtest_stats = backtest_stats
+        return model
 
     @classmethod
     def auto_select_model(
@@ -90,8 +99,17 @@ class ForecastOperatorModelFactory:
         str
             The type of the model.
         """
+        return cls._auto_select_model(datasets, operator_config)[0]
+
+    @classmethod
+    def _auto_select_model(
+        cls, datasets: ForecastDatasets, operator_config: ForecastOperatorConfig
+    ) -> Tuple[str, pd.DataFrame]:
+        """Selects the model, same as `auto_select_model`.
+        Also returns the backtest statistics of all the evaluated models."""
         all_models = operator_config.spec.model_kwargs.get("model_list", cls._MAP.keys())
         num_backtests = operator_config.spec.model_kwargs.get("num_backtests", 5)
         sample_ratio = operator_config.spec.model_kwargs.get("sample_ratio", 0.20)
         model_evaluator = ModelEvaluator(all_models, num_backtests, sample_ratio)
-        return model_evaluator.find_best_model(datasets, operator_config)
\ No newline at end of file
+        best_model = model_evaluator.find_best_model(datasets, operator_config)
+        return best_model, model_evaluator.backtest_stats
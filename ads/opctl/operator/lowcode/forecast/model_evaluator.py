@@ -35,6 +35,7 @@ class ModelEvaluator:
         self.k = k
         self.subsample_ratio = subsample_ratio
         self.minimum_sample_count = 5
+        self.backtest_stats = None
 
     def generate_cutoffs(self, unique_dates, horizon):
         sorted_dates = np.sort(unique_dates)
@@ -141,6 +142,7 @@ class ModelEvaluator:
         logger.info(f"Among models {self.models}, {best_model} model shows better performance during backtesting.")
         backtest_stats = pd.DataFrame(metrics).rename_axis('backtest')
         backtest_stats.reset_index(inplace=True)
+        self.backtest_stats = backtest_stats
         output_dir = operator_config.spec.output_directory.url
         backtest_report_name = "backtest_stats.csv"
         backtest_stats.to_csv(f"{output_dir}/{backtest_report_name}", index=False)
@@ -12,17 +12,7 @@ import fsspec
 import numpy as np
 import pandas as pd
 import cloudpickle
-import plotly.express as px
-from plotly import graph_objects as go
-from sklearn.metrics import (
-    explained_variance_score,
-    mean_absolute_percentage_error,
-    mean_squared_error,
-)
-try:
-    from scipy.stats import linregress
-except:
-    from sklearn.metrics import r2_score
+from sklearn.metrics import mean_absolute_percentage_error
 
 from ads.common.object_storage_details import ObjectStorageDetails
 from ads.dataset.label_encoder import DataFrameLabelEncoder
@@ -33,12 +23,13 @@ from .errors import ForecastInputDataError, ForecastSchemaYamlError
 from .operator_config import ForecastOperatorSpec, ForecastOperatorConfig
 from ads.opctl.operator.lowcode.common.utils import merge_category_columns
 from ads.opctl.operator.lowcode.forecast.const import ForecastOutputColumns
-import report_creator as rc
 
 
-def _label_encode_dataframe(df, no_encode=set()):
-    df_to_encode = df[list(set(df.columns) - no_encode)]
-    le = DataFrameLabelEncoder().fit(df_to_encode)
+def _label_encode_dataframe(df, no_encode=set(), le=None):
+    """Label encodes the dataframe. When a fitted `le` is given, it is only used to transform the dataframe."""
+    if le is None:
+        df_to_encode = df[list(set(df.columns) - no_encode)]
+        le = DataFrameLabelEncoder().fit(df_to_encode)
     return le, le.transform(df)
 
 
@@ -126,7 +117,7 @@ def _build_metrics_per_horizon(
     totals = test_df.sum(numeric_only=True)
     wmape_weights = np.array((totals / totals.sum()).values)
 
-    metrics_df = pd.DataFrame()
+    metric_frames = []
     for date in dates:
         y_true = test_df.xs(date, level=ForecastOutputColumns.DATE)[
             test_data.target_name
@@ -137,9 +128,10 @@ def _build_metrics_per_horizon(
         y_true = np.array(y_true.values)
         y_pred = np.array(y_pred.values)
 
-        drop_na_mask = ~np.isnan(y_true) & ~np.isnan(y_pred)
-        if not drop_na_mask.all():  # There is a missing value
-            if drop_na_mask.any():  # All values are missing
+        drop_na_mask = ~(np.isnan(y_true) | np.isnan(y_pred))
+        n_valid = np.count_nonzero(drop_na_mask)
+        if n_valid < drop_na_mask.size:  # There is a missing value
+            if n_valid == 0:  # All values are missing
                 logger.debug(
                     f"No test data available for date: {date}. This will affect the test metrics."
                 )
@@ -153,23 +145,21 @@ def _build_metrics_per_horizon(
         mapes = mean_absolute_percentage_error(y_true=y_true, y_pred=y_pred)
         wmapes = mapes * wmape_weights
 
-        metrics_df = pd.concat(
-            [
-                metrics_df,
-                pd.DataFrame(
-                    {
-                        SupportedMetrics.MEAN_SMAPE: np.mean(smapes),
-                        SupportedMetrics.MEDIAN_SMAPE: np.median(smapes),
-                        SupportedMetrics.MEAN_MAPE: np.mean(mapes),
-                        SupportedMetrics.MEDIAN_MAPE: np.median(mapes),
-                        SupportedMetrics.MEAN_WMAPE: np.mean(wmapes),
-                        SupportedMetrics.MEDIAN_WMAPE: np.median(wmapes),
-                    },
-                    index=[date],
-                ),
-            ]
+        metric_frames.append(
+            pd.DataFrame(
+                {
+                    SupportedMetrics.MEAN_SMAPE: np.mean(smapes),
+                    SupportedMetrics.MEDIAN_SMAPE: np.median(smapes),
+                    SupportedMetrics.MEAN_MAPE: np.mean(mapes),
+                    SupportedMetrics.MEDIAN_MAPE: np.median(mapes),
+                    SupportedMetrics.MEAN_WMAPE: np.mean(wmapes),
+                    SupportedMetrics.MEDIAN_WMAPE: np.median(wmapes),
+                },
+                index=[date],
+            )
         )
-    return metrics_df
+    # Concatenate once, rather than growing the dataframe in the loop.
+    return pd.concat(metric_frames) if metric_frames else pd.DataFrame()
 
 
 def load_pkl(filepath):
@@ -192,21 +182,91 @@ def write_pkl(obj, filename, output_dir, storage_options):
         cloudpickle.dump(obj, f)
 
 
-def _build_metrics_df(y_true, y_pred, series_id):
-    if len(y_true) == 0 or len(y_pred) == 0:
-        return pd.DataFrame()
-    metrics = dict()
-    metrics["sMAPE"] = smape(actual=y_true, predicted=y_pred)
-    metrics["MAPE"] = mean_absolute_percentage_error(y_true=y_true, y_pred=y_pred)
-    metrics["RMSE"] = np.sqrt(mean_squared_error(y_true=y_true, y_pred=y_pred))
-    try:
-        metrics["r2"] = linregress(y_true, y_pred).rvalue ** 2
-    except:
-        metrics["r2"] = r2_score(y_true=y_true, y_pred=y_pred)
-    metrics["Explained Variance"] = explained_variance_score(
-        y_true=y_true, y_pred=y_pred
+def _build_metrics_df_by_series(y_true, y_pred, series_ids):
+    """
+    Calculates sMAPE, MAPE, RMSE, r2 and Explained Variance for all the series in one pass.
+
+    Parameters
+    ------------
+    y_true:  np.ndarray
+            2D array with the actual values, one row per series
+    y_pred:  np.ndarray
+            2D array with the forecasted values, in the same shape as y_true
+    series_ids: List
+            The series ids of the rows
+
+    Returns
+    --------
+    Pandas Dataframe
+        Dataframe with one row per metric and one column per series.
+        Values missing (NaN) in either y_true or y_pred are ignored.
+    """
+    mask = ~(np.isnan(y_true) | np.isnan(y_pred))
+    n = mask.sum(axis=1)
+    y_true = np.where(mask, y_true, 0.0)
+    y_pred = np.where(mask, y_pred, 0.0)
+
+    def _mean(values):
+        return np.sum(values, axis=1) / n
+
+    def _deviation(values):
+        return np.where(mask, values - _mean(values)[:, None], 0.0)
+
+    def _is_constant(values):
+        return np.max(np.where(mask, values, -np.inf), axis=1) == np.min(
+            np.where(mask, values, np.inf), axis=1
+        )
+
+    error = y_true - y_pred
+    abs_error = np.abs(error)
+    denominator = np.abs(y_true) + np.abs(y_pred)
+    denominator[denominator == 0] = 1
+    smapes = np.round(_mean(abs_error / denominator) * 100, 2)
+    mapes = _mean(abs_error / np.maximum(np.abs(y_true), np.finfo(np.float64).eps))
+    sse = np.sum(error**2, axis=1)
+    rmses = np.sqrt(sse / n)
+
+    true_deviation = _deviation(y_true)
+    pred_deviation = _deviation(y_pred)
+    ss_true = _mean(true_deviation**2)
+    ss_pred = _mean(pred_deviation**2)
+    ss_cross = _mean(true_deviation * pred_deviation)
+    constant_true = _is_constant(y_true)
+    error_variance = _mean(_deviation(error) ** 2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Same as scipy.stats.linregress: r is 0 when either of the series is constant.
+        r = np.clip(ss_cross / np.sqrt(ss_true * ss_pred), -1.0, 1.0)
+        r2s = np.where(constant_true | _is_constant(y_pred), 0.0, r**2)
+        # When all the actual values are identical, r is not defined and r2 is the same as sklearn.metrics.r2_score.
+        r2s = np.where(constant_true & (n > 1), np.where(sse == 0, 1.0, 0.0), r2s)
+        # Same as sklearn.metrics.explained_variance_score with force_finite=True
+        explained_variances = np.where(
+            error_variance == 0,
+            1.0,
+            np.where(ss_true == 0, 0.0, 1 - error_variance / ss_true),
+        )
+
+    return pd.DataFrame(
+        [smapes, mapes, rmses, r2s, explained_variances],
+        index=[
+            SupportedMetrics.SMAPE,
+            SupportedMetrics.MAPE,
+            SupportedMetrics.RMSE,
+            SupportedMetrics.R2,
+            SupportedMetrics.EXPLAINED_VARIANCE,
+        ],
+        columns=series_ids,
     )
-    return pd.DataFrame.from_dict(metrics, orient="index", columns=[series_id])
+
+
+def _stack_series(values_list):
+    """Stacks the 1D arrays into one 2D array, one row per array, padding the shorter rows with NaN."""
+    width = max(len(values) for values in values_list)
+    stacked = np.full((len(values_list), width), np.nan)
+    for i, values in enumerate(values_list):
+        stacked[i, : len(values)] = values
+    return stacked
 
 
 def evaluate_train_metrics(output, metrics_col_name=None):
@@ -220,7 +280,9 @@ def evaluate_train_metrics(output, metrics_col_name=None):
             Only passed in if the series column was created artifically.
             When passed in, replaces s_id as the column name in the metrics table
     """
-    total_metrics = pd.DataFrame()
+    series_ids = []
+    y_true_list = []
+    y_pred_list = []
     for s_id in output.list_series_ids():
         try:
             forecast_by_s_id = output.get_forecast(s_id)[
@@ -229,33 +291,39 @@ def evaluate_train_metrics(output, metrics_col_name=None):
             forecast_by_s_id = forecast_by_s_id.dropna()
             y_true = forecast_by_s_id["input_value"].values
             y_pred = forecast_by_s_id["fitted_value"].values
-            drop_na_mask = ~np.isnan(y_true) & ~np.isnan(y_pred)
-            if not drop_na_mask.all():  # There is a missing value
-                if drop_na_mask.any():  # All values are missing
-                    logger.debug(
-                        f"No fitted values available for series: {s_id}. This will affect the training metrics."
-                    )
-                    continue
+            drop_na_mask = ~(np.isnan(y_true) | np.isnan(y_pred))
+            n_valid = np.count_nonzero(drop_na_mask)
+            if n_valid == 0:  # All values are missing
+                logger.debug(
+                    f"No fitted values available for series: {s_id}. This will affect the training metrics."
+                )
+                continue
+            if n_valid < drop_na_mask.size:  # There is a missing value
                 logger.debug(
                     f"Missing fitted values for series: {s_id}. This will affect the training metrics."
                 )
-                y_true = y_true[drop_na_mask]
-                y_pred = y_pred[drop_na_mask]
-            metrics_df = _build_metrics_df(
-                y_true=y_true,
-                y_pred=y_pred,
-                series_id=s_id,
-            )
-            total_metrics = pd.concat([total_metrics, metrics_df], axis=1)
+            series_ids.append(s_id)
+            y_true_list.append(y_true)
+            y_pred_list.append(y_pred)
         except Exception as e:
             logger.debug(
                 f"Failed to generate training metrics for target_series: {s_id}"
             )
             logger.debug(f"Recieved Error Statement: {e}")
-    return total_metrics
+
+    if not series_ids:
+        return pd.DataFrame()
+    # Generate the metrics for all the series at once, the missing values are ignored.
+    return _build_metrics_df_by_series(
+        y_true=_stack_series(y_true_list),
+        y_pred=_stack_series(y_pred_list),
+        series_ids=series_ids,
+    )
 
 
 def _select_plot_list(fn, series_ids):
+    import report_creator as rc
+
     blocks = [rc.Widget(fn(s_id=s_id), label=s_id) for s_id in series_ids]
     return rc.Select(blocks=blocks) if len(blocks) > 1 else blocks[0]
 
@@ -264,6 +332,9 @@ def _add_unit(num, unit):
     return f"{num} {unit}"
 
 def get_auto_select_plot(backtest_results):
+    import report_creator as rc
+    from plotly import graph_objects as go
+
     fig = go.Figure()
     columns = backtest_results.columns.tolist()
     back_test_column = "backtest"
@@ -287,6 +358,8 @@ def get_forecast_plots(
     test_data=None,
     ci_interval_width=0.95,
 ):
+    from plotly import graph_objects as go
+
     def plot_forecast_plotly(s_id):
         fig = go.Figure()
         forecast_i = forecast_output.get_forecast(s_id)
@@ -21,6 +21,8 @@ from ads.opctl.operator.cmd import run
 from ads.opctl.operator.lowcode.common.utils import (
     get_frequency_of_datetime,
     get_frequency_in_seconds,
+    datetime_to_seconds,
+    seconds_to_datetime,
 )
 
 
@@ -56,3 +58,14 @@ def test_frequency_heplers():
         #     == to_offset(pd.Timedelta(f"{step_size}{unit}")).freqstr
         # )
         assert get_frequency_in_seconds(dt_col) == delta.total_seconds()
+
+
+@pytest.mark.parametrize("tz", [None, "US/Eastern"])
+def test_datetime_to_seconds(tz):
+    dt_col = pd.Series(
+        pd.date_range("2022-12-10 22:45:59.5", periods=50, freq="37h", tz=tz)
+    )
+    seconds = datetime_to_seconds(dt_col)
+    assert seconds.equals(dt_col.apply(lambda x: x.timestamp()))
+    if tz is None:
+        assert seconds_to_datetime(seconds).equals(dt_col)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2024 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+
+import numpy as np
+import pandas as pd
+
+from ads.dataset.label_encoder import DataFrameLabelEncoder
+
+
+class TestDataFrameLabelEncoder:
+    train_df = pd.DataFrame(
+        {
+            "str": ["b", "a", "unknown", None],
+            "bool": [True, False, True, False],
+            "category": pd.Categorical(["x", "y", "x", "y"]),
+            "num": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+    test_df = pd.DataFrame(
+        {
+            "str": ["a", "new", "unknown", None, "b"],
+            "bool": [False, True, True, False, True],
+            "category": pd.Categorical(["y", "z", "x", "x", "y"]),
+            "num": [5.0, 6.0, 7.0, 8.0, 9.0],
+        }
+    )
+
+    def test_fit(self):
+        """Validate the classes of the categorical columns include the unknown class."""
+        le = DataFrameLabelEncoder().fit(self.train_df.copy())
+        assert set(le.label_encoders.keys()) == {"str", "bool", "category"}
+        assert le.label_encoders["str"].classes_.tolist() == [
+            "None",
+            "a",
+            "b",
+            "unknown",
+            "unknown",
+        ]
+        assert le.label_encoders["bool"].classes_.tolist() == [
+            "False",
+            "True",
+            "unknown",
+        ]
+        assert le.label_encoders["category"].classes_.tolist() == [
+            "unknown",
+            "x",
+            "y",
+        ]
+
+    def test_transform(self):
+        """Validate unseen values are encoded as unknown and the other columns are not changed."""
+        le = DataFrameLabelEncoder().fit(self.train_df.copy())
+        encoded = le.transform(self.test_df.copy())
+        # "unknown" is also a training value, both the value and the unseen "new"
+        # get the code of the last "unknown" class, same as LabelEncoder.transform.
+        assert encoded["str"].tolist() == [1, 4, 4, 0, 2]
+        assert encoded["bool"].tolist() == [0, 1, 1, 0, 1]
+        assert encoded["category"].tolist() == [2, 0, 1, 1, 2]
+        for col in ["str", "bool", "category"]:
+            assert encoded[col].dtype == np.int64
+        pd.testing.assert_series_equal(encoded["num"], self.test_df["num"])
+
+    def test_transform_same_as_label_encoder(self):
+        """Validate the encoding of the seen values is the same as LabelEncoder.transform."""
+        le = DataFrameLabelEncoder().fit(self.train_df.copy())
+        encoded = le.transform(self.train_df.copy())
+        for col in ["str", "bool", "category"]:
+            expected = le.label_encoders[col].transform(self.train_df[col].astype(str))
+            assert encoded[col].tolist() == expected.tolist()
+
+    def test_transform_bytes(self):
+        """Validate bytes values are encoded as the seen class they decode to, same as fit."""
+        le = DataFrameLabelEncoder().fit(self.train_df.copy())
+        test_df = pd.DataFrame(
+            {
+                "str": [b"a", b"b", b"new"],
+                "bool": [True, False, True],
+                "category": pd.Categorical(["x", "y", "x"]),
+                "num": [1.0, 2.0, 3.0],
+            }
+        )
+        encoded = le.transform(test_df)
+        assert encoded["str"].tolist() == [1, 2, 4]
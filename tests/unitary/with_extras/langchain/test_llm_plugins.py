@@ -6,9 +6,11 @@
 
 import pytest
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from ads.llm import ModelDeploymentTGI
+import ads
+from ads.llm import GenerativeAI, ModelDeploymentTGI
+from ads.llm.langchain.plugins import base
 from oci.signer import Signer
 
 
@@ -63,3 +65,95 @@ class LangChainPluginsTest(unittest.TestCase):
         response = llm("who am i")
         completion = "ads"
         assert response == completion
+
+    @patch("ads.common.auth.default_signer")
+    @patch("ads.llm.langchain.plugins.base.default_signer")
+    def test_generative_ai_construct_with_client(
+        self, mock_default_signer, mock_auth_default_signer
+    ):
+        base._cached_default_signer.cache_clear()
+        client = MagicMock()
+        llm = GenerativeAI.construct_with_client(
+            client=client, compartment_id="ocid1.compartment.oc1..<ocid>"
+        )
+        assert llm.client is client
+        assert llm.compartment_id == "ocid1.compartment.oc1..<ocid>"
+        assert llm.model == "cohere.command"
+        assert llm.max_tokens == 256
+        assert llm.auth == {}
+        mock_default_signer.assert_not_called()
+        mock_auth_default_signer.assert_not_called()
+
+    def test_generative_ai_p(self):
+        llm = GenerativeAI(compartment_id="ocid1.compartment.oc1..<ocid>", p=0.9)
+        assert llm.p == 0.9
+
+    def _mock_llama(self, texts):
+        client = MagicMock()
+        client.generate_text.return_value.data.inference_response.choices = [
+            MagicMock(text=text) for text in texts
+        ]
+        llm = GenerativeAI.construct_with_client(
+            client=client,
+            compartment_id="ocid1.compartment.oc1..<ocid>",
+            model="meta.llama-2-70b-chat",
+        )
+        return llm, client
+
+    def test_generative_ai_llama_stop(self):
+        llm, client = self._mock_llama(["The answer is 42.\nQuestion: why?"])
+        assert llm("What is the answer?", stop=["\nQuestion:"]) == "The answer is 42."
+        client.generate_text.assert_called_once()
+
+    def test_generative_ai_llama_stop_num_generations(self):
+        llm, _ = self._mock_llama(
+            ["Yes.\nQuestion: why?", "No.\nQuestion: how?", "Maybe."]
+        )
+        completions = llm.batch_completion(
+            "Is it?", stop=["\nQuestion:"], num_generations=3
+        )
+        assert completions == ["Yes.", "No.", "Maybe."]
+
+    def test_cut_at_stop(self):
+        text = "Why did the chicken cross the road? To get to the other side."
+        assert ModelDeploymentTGI._cut_at_stop(text, None) == text
+        assert ModelDeploymentTGI._cut_at_stop(text, ["", "Why not"]) == text
+        assert (
+            ModelDeploymentTGI._cut_at_stop(text, ["side", "?", "road"])
+            == "Why did the chicken cross the "
+        )
+
+    def tearDown(self):
+        ads.set_auth()
+        base._cached_default_signer.cache_clear()
+
+    @patch("ads.llm.langchain.plugins.base.default_signer")
+    def test_default_signer_cache(self, mock_default_signer):
+        mock_default_signer.side_effect = lambda: {"config": {}, "signer": object()}
+        base._cached_default_signer.cache_clear()
+        ads.set_auth()
+
+        auth = base._default_signer()
+        auth["client_kwargs"] = {"timeout": 60}
+        assert base._default_signer() == {"config": {}, "signer": auth["signer"]}
+        mock_default_signer.assert_called_once()
+
+        # Changing the auth settings loads the signer again.
+        ads.set_auth(profile="TEST")
+        assert base._default_signer()["signer"] is not auth["signer"]
+        assert mock_default_signer.call_count == 2
+
+    @patch("ads.llm.langchain.plugins.base.default_signer")
+    def test_default_signer_not_cached(self, mock_default_signer):
+        base._cached_default_signer.cache_clear()
+
+        # The security token is refreshed when the signer is created.
+        ads.set_auth("security_token")
+        base._default_signer()
+        base._default_signer()
+        assert mock_default_signer.call_count == 2
+
+        ads.set_auth(signer_callable=MagicMock())
+        base._default_signer()
+        base._default_signer()
+        assert mock_default_signer.call_count == 4
@@ -1,11 +1,65 @@
 #!/usr/bin/env python
 # -*- coding: utf-8; -*-
 
-# Copyright (c) 2023 Oracle and/or its affiliates.
+# Copyright (c) 2023, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import numpy as np
+import pandas as pd
+from scipy.stats import linregress
+from sklearn.metrics import (
+    explained_variance_score,
+    mean_absolute_percentage_error,
+    mean_squared_error,
+    r2_score,
+)
+
+from ads.opctl.operator.lowcode.forecast.const import SupportedMetrics
+from ads.opctl.operator.lowcode.forecast.utils import (
+    _build_metrics_df_by_series,
+    smape,
+)
+
 
 class TestCommonUtils:
     """Tests all common utils methods of the forecast operator."""
 
-    pass
+    def test_build_metrics_df_by_series(self):
+        """Ensures the metrics of all series match the metrics calculated series by series."""
+        rng = np.random.default_rng(42)
+        y_true = rng.normal(10, 5, (5, 6))
+        y_pred = y_true + rng.normal(0, 2, (5, 6))
+        y_true[1, 2] = np.nan
+        y_pred[2, [0, 5]] = np.nan
+        y_pred[3] = 4.0
+        y_true[4] = 7.0
+        series_ids = ["A", "B", "C", "D", "E"]
+
+        expected = {}
+        for s_id, t, p in zip(series_ids, y_true, y_pred):
+            mask = ~np.isnan(t) & ~np.isnan(p)
+            t, p = t[mask], p[mask]
+            expected[s_id] = [
+                smape(actual=t, predicted=p),
+                mean_absolute_percentage_error(y_true=t, y_pred=p),
+                np.sqrt(mean_squared_error(y_true=t, y_pred=p)),
+                # linregress is not defined when all the actual values are identical
+                r2_score(y_true=t, y_pred=p)
+                if np.all(t == t[0])
+                else linregress(t, p).rvalue ** 2,
+                explained_variance_score(y_true=t, y_pred=p),
+            ]
+        expected = pd.DataFrame(
+            expected,
+            index=[
+                SupportedMetrics.SMAPE,
+                SupportedMetrics.MAPE,
+                SupportedMetrics.RMSE,
+                SupportedMetrics.R2,
+                SupportedMetrics.EXPLAINED_VARIANCE,
+            ],
+        )
+        result = _build_metrics_df_by_series(
+            y_true=y_true, y_pred=y_pred, series_ids=series_ids
+        )
+        pd.testing.assert_frame_equal(result, expected)
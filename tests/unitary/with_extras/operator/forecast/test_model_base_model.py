@@ -1,8 +1,106 @@
-# #!/usr/bin/env python
-# # -*- coding: utf-8; -*-
+#!/usr/bin/env python
+# -*- coding: utf-8; -*-
+
+# Copyright (c) 2023, 2024 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+
+import json
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ads.opctl.operator.lowcode.forecast.model.base_model import (
+    ForecastOperatorBaseModel,
+)
+
+
+class TestForecastOperatorBaseModel:
+    """Tests the base class methods of the forecast operator models."""
+
+    def test_save_model_parameters_json(self):
+        """Ensures numpy and pandas values in the model parameters are written as valid json."""
+        model_parameters = {
+            "A": {
+                "delta": np.array([[0.5, -1.5]]),
+                "changepoints": pd.Series([1.0, 2.0], index=[1, 2]),
+                "n_changepoints": np.int64(2),
+                "scale": np.nan,
+                "growth": "linear",
+            }
+        }
+        with tempfile.TemporaryDirectory() as output_dir:
+            model = SimpleNamespace(
+                spec=SimpleNamespace(
+                    output_directory=SimpleNamespace(url=output_dir),
+                    generate_report=False,
+                    forecast_filename="forecast.csv",
+                    generate_metrics=False,
+                    generate_explanations=False,
+                    generate_model_parameters=True,
+                    generate_model_pickle=False,
+                ),
+                model_parameters=model_parameters,
+                errors_dict=dict(),
+            )
+            ForecastOperatorBaseModel._save_report(
+                model,
+                report_sections=[],
+                result_df=pd.DataFrame({"forecast_value": [1.0]}),
+                metrics_df=None,
+                test_metrics_df=None,
+            )
+
+            def _invalid_constant(value):
+                raise ValueError(f"Invalid json value: {value}")
+
+            with open(os.path.join(output_dir, "model_params.json")) as f:
+                params = json.load(f, parse_constant=_invalid_constant)
+
+        assert params == {
+            "A": {
+                "delta": [[0.5, -1.5]],
+                "changepoints": {"1": 1.0, "2": 2.0},
+                "n_changepoints": 2,
+                "scale": None,
+                "growth": "linear",
+            }
+        }
+
+    @pytest.mark.parametrize("explain_series_in_parallel", [True, False])
+    def test_explain_model_order(self, explain_series_in_parallel):
+        """Ensures the explanations are in the order of the series, regardless of which series finishes first."""
+        series_ids = ["A", "B", "C", "D", "E", "F", "G", "H"]
+
+        def _explain_series(s_id, data_i, ratio, datetime_col_name):
+            # The first series finish last.
+            time.sleep(0.01 * (len(series_ids) - series_ids.index(s_id)))
+            return {"x": float(data_i)}, pd.DataFrame({"x": [data_i]}), (0.1, 0.2)
+
+        model = SimpleNamespace(
+            models={s_id: None for s_id in series_ids},
+            datasets=SimpleNamespace(
+                _datetime_column_name="Date",
+                get_data_by_series=lambda include_horizon: {
+                    s_id: i for i, s_id in enumerate(series_ids)
+                },
+            ),
+            spec=SimpleNamespace(explanations_accuracy_mode="HIGH_ACCURACY"),
+            global_explanation=dict(),
+            local_explanation=dict(),
+            _explain_series=_explain_series,
+            explain_series_in_parallel=explain_series_in_parallel,
+        )
+        ForecastOperatorBaseModel.explain_model(model)
+
+        assert list(model.global_explanation) == series_ids
+        assert list(model.local_explanation) == series_ids
+        assert model.global_explanation["C"] == {"x": 2.0}
 
-# # Copyright (c) 2023, 2024 Oracle and/or its affiliates.
-# # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 # import unittest
 # from unittest.mock import patch, Mock
@@ -1,11 +1,56 @@
 #!/usr/bin/env python
 # -*- coding: utf-8; -*-
 
-# Copyright (c) 2023 Oracle and/or its affiliates.
+# Copyright (c) 2023, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from ads.opctl.operator.lowcode.forecast.const import AUTO_SELECT
+from ads.opctl.operator.lowcode.forecast.model.factory import (
+    ForecastOperatorModelFactory,
+)
+
 
 class TestForecastOperatorModelFactory:
     """Tests the factory class which contains a list of registered forecasting operator models."""
 
-    pass
+    backtest_stats = pd.DataFrame({"backtest": [0, 1], "prophet": [1.0, 2.0]})
+
+    def _mock_model_evaluator(self, mock_model_evaluator):
+        model_evaluator = mock_model_evaluator.return_value
+        model_evaluator.find_best_model.return_value = "prophet"
+        model_evaluator.backtest_stats = self.backtest_stats
+
+    @patch("ads.opctl.operator.lowcode.forecast.model.factory.ModelEvaluator")
+    def test_auto_select_model(self, mock_model_evaluator):
+        """Ensures auto_select_model returns the type of the best model."""
+        self._mock_model_evaluator(mock_model_evaluator)
+        operator_config = SimpleNamespace(spec=SimpleNamespace(model_kwargs={}))
+        assert (
+            ForecastOperatorModelFactory.auto_select_model(
+                datasets=None, operator_config=operator_config
+            )
+            == "prophet"
+        )
+
+    @patch("ads.opctl.operator.lowcode.forecast.model.factory.ModelEvaluator")
+    def test_get_model_auto_select(self, mock_model_evaluator):
+        """Ensures the auto-selected model is given the backtest statistics."""
+        self._mock_model_evaluator(mock_model_evaluator)
+        operator_config = SimpleNamespace(
+            spec=SimpleNamespace(model=AUTO_SELECT, model_kwargs={})
+        )
+        mock_model_class = MagicMock()
+        with patch.dict(
+            ForecastOperatorModelFactory._MAP, {"prophet": mock_model_class}
+        ):
+            model = ForecastOperatorModelFactory.get_model(
+                operator_config=operator_config, datasets=None
+            )
+        assert model is mock_model_class.return_value
+        assert model.backtest_stats is self.backtest_stats
+        assert operator_config.spec.model_kwargs == dict()